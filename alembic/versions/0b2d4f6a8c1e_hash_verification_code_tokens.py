@@ -0,0 +1,60 @@
+"""hash verification code tokens
+
+Revision ID: 0b2d4f6a8c1e
+Revises: 1a3c5e7b9d2f
+Create Date: 2026-10-16 02:04:13.557802
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b2d4f6a8c1e"
+down_revision: Union[str, Sequence[str], None] = "1a3c5e7b9d2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f("ix_verification_code_token"), table_name="verification_code")
+    # outstanding links keep working: the stored value becomes sha256(token)
+    op.alter_column(
+        "verification_code",
+        "token",
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="sha256(convert_to(token, 'UTF8'))",
+    )
+    op.create_index(
+        "ix_verification_code_token",
+        "verification_code",
+        ["token"],
+        unique=False,
+        postgresql_using="hash",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_verification_code_token",
+        table_name="verification_code",
+        postgresql_using="hash",
+    )
+    # the original tokens cannot be recovered from their digests
+    op.execute("DELETE FROM verification_code")
+    op.alter_column(
+        "verification_code",
+        "token",
+        type_=sa.String(),
+        existing_nullable=False,
+        postgresql_using="encode(token, 'hex')",
+    )
+    op.create_index(
+        op.f("ix_verification_code_token"), "verification_code", ["token"], unique=False
+    )
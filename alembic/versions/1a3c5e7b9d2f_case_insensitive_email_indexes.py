@@ -0,0 +1,72 @@
+"""case insensitive email indexes
+
+Revision ID: 1a3c5e7b9d2f
+Revises: 5e7a9c2d4b6f
+Create Date: 2026-10-16 01:31:58.209466
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1a3c5e7b9d2f"
+down_revision: Union[str, Sequence[str], None] = "5e7a9c2d4b6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("contact", "user", "waitlist")
+
+
+def abort_if(condition: str, message: str) -> None:
+    """Fail the migration with message, before anything is altered, when the
+    SQL condition holds; runs server side so --sql output keeps the check"""
+    op.execute(
+        f"DO $$ BEGIN IF {condition} THEN RAISE EXCEPTION '{message}'; END IF; END $$"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        abort_if(
+            f'EXISTS (SELECT 1 FROM "{table}" WHERE length(email) > 320)',
+            f"{table}.email has values longer than 320 characters; "
+            "fix them before shrinking the column",
+        )
+    # the old exact-match uniqueness allowed addresses differing only in case
+    for table in ("user", "waitlist"):
+        abort_if(
+            f'EXISTS (SELECT 1 FROM "{table}" GROUP BY lower(email) '
+            "HAVING count(*) > 1)",
+            f"{table} has emails that differ only in case; merge them before "
+            "adding the case-insensitive unique index",
+        )
+
+    for table in TABLES:
+        op.alter_column(
+            table, "email", type_=sa.String(length=320), existing_nullable=False
+        )
+
+    op.drop_constraint("user_email_key", "user", type_="unique")
+    op.create_index(
+        "ix_user_email_lower", "user", [sa.text("lower(email)")], unique=True
+    )
+    op.drop_index(op.f("ix_waitlist_email"), table_name="waitlist")
+    op.create_index(
+        "ix_waitlist_email_lower", "waitlist", [sa.text("lower(email)")], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_waitlist_email_lower", table_name="waitlist")
+    op.create_index(op.f("ix_waitlist_email"), "waitlist", ["email"], unique=True)
+    op.drop_index("ix_user_email_lower", table_name="user")
+    op.create_unique_constraint("user_email_key", "user", ["email"])
+
+    for table in TABLES:
+        op.alter_column(table, "email", type_=sa.String(), existing_nullable=False)
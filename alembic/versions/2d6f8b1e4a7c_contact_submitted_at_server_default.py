@@ -0,0 +1,29 @@
+"""contact submitted_at server default
+
+Revision ID: 2d6f8b1e4a7c
+Revises: 7e2a5c9d3f1b
+Create Date: 2026-10-15 23:57:36.281054
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2d6f8b1e4a7c"
+down_revision: Union[str, Sequence[str], None] = "7e2a5c9d3f1b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column("contact", "submitted_at", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column("contact", "submitted_at", server_default=None)
@@ -0,0 +1,38 @@
+"""uuidv7 for high volume tables
+
+Revision ID: 3f9b2d6a8c4e
+Revises: 8a4c1e7b5d2f
+Create Date: 2026-10-16 00:21:05.118394
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9b2d6a8c4e"
+down_revision: Union[str, Sequence[str], None] = "8a4c1e7b5d2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    "contact",
+    "session",
+    "verification_code",
+    "waitlist",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=sa.text("uuidv7()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
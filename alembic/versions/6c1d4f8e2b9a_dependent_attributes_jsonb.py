@@ -0,0 +1,220 @@
+"""dependent attributes jsonb
+
+Revision ID: 6c1d4f8e2b9a
+Revises: 3f9b2d6a8c4e
+Create Date: 2026-10-16 00:42:51.602378
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c1d4f8e2b9a"
+down_revision: Union[str, Sequence[str], None] = "3f9b2d6a8c4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "dependent",
+        sa.Column(
+            "attributes",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        UPDATE dependent SET attributes = jsonb_build_object('species', lower(pet_dependent.species::text))
+        FROM pet_dependent WHERE pet_dependent.dependent_id = dependent.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE dependent SET attributes = jsonb_build_object('gender', lower(senior_dependent.gender::text))
+        FROM senior_dependent WHERE senior_dependent.dependent_id = dependent.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE dependent SET attributes = jsonb_build_object('gender', lower(child_dependent.gender::text))
+        FROM child_dependent
+        WHERE child_dependent.dependent_id = dependent.id AND child_dependent.gender IS NOT NULL
+        """
+    )
+    op.create_index(
+        "ix_dependent_attributes",
+        "dependent",
+        ["attributes"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"attributes": "jsonb_path_ops"},
+    )
+
+    op.drop_index(
+        op.f("ix_senior_dependent_dependent_id"), table_name="senior_dependent"
+    )
+    op.drop_table("senior_dependent")
+    op.drop_index(op.f("ix_pet_dependent_dependent_id"), table_name="pet_dependent")
+    op.drop_table("pet_dependent")
+    op.drop_index(op.f("ix_child_dependent_dependent_id"), table_name="child_dependent")
+    op.drop_table("child_dependent")
+    sa.Enum(name="seniordependentgenderenum").drop(op.get_bind())
+    sa.Enum(name="petdependentspeciesenum").drop(op.get_bind())
+    sa.Enum(name="childgenderenum").drop(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        "child_dependent",
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("dependent_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "gender", sa.Enum("MALE", "FEMALE", name="childgenderenum"), nullable=True
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["dependent_id"], ["dependent.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_child_dependent_dependent_id"),
+        "child_dependent",
+        ["dependent_id"],
+        unique=False,
+    )
+    op.create_table(
+        "pet_dependent",
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("dependent_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "species",
+            sa.Enum(
+                "CAT",
+                "DOG",
+                "BIRD",
+                "FISH",
+                "REPTILE",
+                "OTHER",
+                name="petdependentspeciesenum",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["dependent_id"], ["dependent.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_pet_dependent_dependent_id"),
+        "pet_dependent",
+        ["dependent_id"],
+        unique=False,
+    )
+    op.create_table(
+        "senior_dependent",
+        sa.Column(
+            "id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False
+        ),
+        sa.Column("dependent_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "gender",
+            sa.Enum(
+                "MALE",
+                "FEMALE",
+                "OTHER",
+                "PREFER_NOT_TO_SAY",
+                name="seniordependentgenderenum",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["dependent_id"], ["dependent.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_senior_dependent_dependent_id"),
+        "senior_dependent",
+        ["dependent_id"],
+        unique=False,
+    )
+
+    op.execute(
+        """
+        INSERT INTO pet_dependent (dependent_id, species)
+        SELECT id, upper(attributes->>'species')::petdependentspeciesenum
+        FROM dependent WHERE type = 'PET' AND attributes ? 'species'
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO senior_dependent (dependent_id, gender)
+        SELECT id, upper(attributes->>'gender')::seniordependentgenderenum
+        FROM dependent WHERE type = 'SENIOR' AND attributes ? 'gender'
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO child_dependent (dependent_id, gender)
+        SELECT id, upper(attributes->>'gender')::childgenderenum
+        FROM dependent WHERE type = 'CHILD'
+        """
+    )
+
+    op.drop_index(
+        "ix_dependent_attributes",
+        table_name="dependent",
+        postgresql_using="gin",
+        postgresql_ops={"attributes": "jsonb_path_ops"},
+    )
+    op.drop_column("dependent", "attributes")
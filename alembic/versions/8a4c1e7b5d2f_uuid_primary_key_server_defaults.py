@@ -0,0 +1,51 @@
+"""uuid primary key server defaults
+
+Revision ID: 8a4c1e7b5d2f
+Revises: 2d6f8b1e4a7c
+Create Date: 2026-10-16 00:09:44.730162
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4c1e7b5d2f"
+down_revision: Union[str, Sequence[str], None] = "2d6f8b1e4a7c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    "account",
+    "appointment",
+    "caregiver_availability",
+    "child_dependent",
+    "contact",
+    "dependent",
+    "location",
+    "pet_dependent",
+    "role",
+    "senior_dependent",
+    "service",
+    "session",
+    "specialty",
+    "user",
+    "user_information",
+    "verification_code",
+    "waitlist",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=sa.text("gen_random_uuid()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "id", server_default=None)
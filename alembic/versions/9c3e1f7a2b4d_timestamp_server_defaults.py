@@ -0,0 +1,55 @@
+"""timestamp server defaults
+
+Revision ID: 9c3e1f7a2b4d
+Revises: 670b5ad262b2
+Create Date: 2026-10-15 22:58:12.413907
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3e1f7a2b4d"
+down_revision: Union[str, Sequence[str], None] = "670b5ad262b2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    "account",
+    "appointment",
+    "caregiver_availability",
+    "caregiver_information",
+    "careseeker_information",
+    "child_dependent",
+    "contact",
+    "dependent",
+    "location",
+    "pet_dependent",
+    "role",
+    "senior_dependent",
+    "service",
+    "session",
+    "specialty",
+    "user",
+    "user_information",
+    "verification_code",
+    "waitlist",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "created_at", server_default=sa.text("now()"))
+        op.alter_column(table, "updated_at", server_default=sa.text("now()"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, "updated_at", server_default=None)
+        op.alter_column(table, "created_at", server_default=None)
@@ -1,17 +1,38 @@
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import resend
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemLoader
 
+from src.core.config import get_email_settings
 from src.core.logger import setup_logger
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+@lru_cache(maxsize=1)
+def get_jinja_env() -> Environment:
+    """
+    Shared across all clients so each template is loaded and compiled once
+    per process. Built on first use so importing this module needs no email
+    settings; a relative templates_dir is resolved from the project root
+    rather than the working directory.
+    """
+    return Environment(
+        loader=FileSystemLoader(PROJECT_ROOT / get_email_settings().templates_dir),
+        autoescape=True,  # Important for security
+        auto_reload=False,
+        # never evict; there are only a handful of templates
+        cache_size=-1,
+    )
+
 
 class EmailClient:
     def __init__(
         self,
         api_key: str,
         from_email: str,
-        templates_dir: str | Path = "templates/emails",
     ):
         """
         Initialize the email service.
@@ -19,21 +40,14 @@ class EmailClient:
         Args:
             api_key: Resend API key
             from_email: Sender email address (e.g., "Millennicare <noreply@millennicare.com>")
-            templates_dir: Directory containing email templates
         """
         resend.api_key = api_key
         self.from_email = from_email
-
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(templates_dir),
-            autoescape=True,  # Important for security
-        )
         self.logger = setup_logger(__name__)
 
     def _render_template(self, template_name: str, **context) -> str:
-        """Render a Jinja2 template with the given context."""
-        template: Template = self.jinja_env.get_template(template_name)
-        return template.render(**context)
+        """Render a cached Jinja2 template with the given context."""
+        return get_jinja_env().get_template(template_name).render(**context)
 
     def _send_email(
         self,
@@ -56,7 +70,25 @@ class EmailClient:
             "html": html,
         }
         resend.Emails.send(params)
-        self.logger.info(f"EmailClient._send_email - Sent email to {to}")
+        self.logger.info("EmailClient._send_email - Sent email to %s", to)
+
+    def send_in_background(self, send: Callable[..., None], **kwargs) -> None:
+        """
+        Run one of the send_* methods as a background task.
+
+        The response has already been returned by then, so a failure can only
+        be logged; direct calls to the send_* methods still raise.
+
+        Args:
+            send: The send_* method to call
+            **kwargs: Arguments for that method
+        """
+        try:
+            send(**kwargs)
+        except Exception:
+            self.logger.exception(
+                "EmailClient.send_in_background - %s failed", send.__name__
+            )
 
     def send_verification_email(self, email: str, code: str, link: str) -> None:
         """
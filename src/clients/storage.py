@@ -1,29 +1,92 @@
+import asyncio
+import time
+from functools import lru_cache
+
 import boto3
-from botocore.client import Config
+from boto3.s3.transfer import TransferConfig
+from botocore.client import BaseClient, Config
 from botocore.exceptions import ClientError
+from cachetools import TTLCache
 from fastapi import UploadFile
 
-from src.core.config import storage_settings
+from src.core.config import get_storage_settings
 from src.core.logger import setup_logger
 
+MB = 1024 * 1024
+
+# Large uploads are split into parts that are sent concurrently
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+# HEAD results keyed by (bucket, key). Each worker holds its own copy, so
+# the TTL bounds how long a change made through another worker goes unseen.
+METADATA_CACHE_TTL_SECONDS = 120
+_metadata_cache: TTLCache[tuple[str, str], dict] = TTLCache(
+    maxsize=4096, ttl=METADATA_CACHE_TTL_SECONDS
+)
+
+
+@lru_cache(maxsize=1)
+def get_s3_client() -> BaseClient:
+    """
+    S3 client for the R2 endpoint, shared by every StorageClient.
+
+    boto3 clients are thread-safe, so one client and its connection pool
+    are reused instead of being rebuilt per instance.
+    """
+    storage_settings = get_storage_settings()
+    return boto3.client(
+        "s3",
+        endpoint_url=f"https://{storage_settings.cloudflare_account_id}.r2.cloudflarestorage.com",
+        aws_access_key_id=storage_settings.cloudflare_access_key_id,
+        aws_secret_access_key=storage_settings.cloudflare_secret_access_key,
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=64,
+            retries={"mode": "adaptive", "max_attempts": 5},
+            tcp_keepalive=True,
+        ),
+        region_name="auto",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _signed_url(
+    bucket: str,
+    key: str,
+    expiration: int,
+    disposition: str | None,
+    window: int,
+) -> str:
+    """
+    Sign a GET URL for an object, memoised per expiry window.
+
+    The window advances every expiration/2 seconds, so a cached URL is
+    always valid for at least half of its requested lifetime.
+    """
+    params = {"Bucket": bucket, "Key": key}
+    if disposition:
+        params["ResponseContentDisposition"] = disposition
+
+    return get_s3_client().generate_presigned_url(
+        "get_object",
+        Params=params,
+        ExpiresIn=expiration,
+    )
+
 
 class StorageClient:
     def __init__(self):
         """
         Initialize the storage client for Cloudflare R2.
         """
-        self.bucket_name = storage_settings.cloudflare_bucket_name
+        self.bucket_name = get_storage_settings().cloudflare_bucket_name
         self.logger = setup_logger(__name__)
-
-        # Initialize S3 client with R2 endpoint
-        self.client = boto3.client(
-            "s3",
-            endpoint_url=f"https://{storage_settings.cloudflare_account_id}.r2.cloudflarestorage.com",
-            aws_access_key_id=storage_settings.cloudflare_access_key_id,
-            aws_secret_access_key=storage_settings.cloudflare_secret_access_key,
-            config=Config(signature_version="s3v4"),
-            region_name="auto",
-        )
+        self.client = get_s3_client()
 
     async def upload_file(
         self,
@@ -56,12 +119,16 @@ class StorageClient:
             if metadata:
                 extra_args["Metadata"] = metadata
 
-            self.client.upload_fileobj(
+            # boto3 is blocking, so run it in a worker thread to keep the event loop free
+            await asyncio.to_thread(
+                self.client.upload_fileobj,
                 file.file,
                 self.bucket_name,
                 key,
                 ExtraArgs=extra_args if extra_args else None,
+                Config=TRANSFER_CONFIG,
             )
+            _metadata_cache.pop((self.bucket_name, key), None)
 
             self.logger.info(
                 f"StorageClient . upload_fastapi_file . Uploaded {file.filename} to {key}"
@@ -95,18 +162,14 @@ class StorageClient:
             ClientError: If URL generation fails
         """
         try:
-            params = {
-                "Bucket": self.bucket_name,
-                "Key": key,
-            }
-
-            if response_content_disposition:
-                params["ResponseContentDisposition"] = response_content_disposition
-
-            url = self.client.generate_presigned_url(
-                "get_object",
-                Params=params,
-                ExpiresIn=expiration,
+            # Signing is local CPU work, no request is made to R2
+            window = int(time.time() // max(expiration // 2, 1))
+            url = _signed_url(
+                self.bucket_name,
+                key,
+                expiration,
+                response_content_disposition,
+                window,
             )
 
             self.logger.info(
@@ -120,7 +183,7 @@ class StorageClient:
             )
             raise
 
-    def delete_file(self, key: str) -> None:
+    async def delete_file(self, key: str) -> None:
         """
         Delete a file from R2 storage.
 
@@ -131,10 +194,12 @@ class StorageClient:
             ClientError: If deletion fails
         """
         try:
-            self.client.delete_object(
+            await asyncio.to_thread(
+                self.client.delete_object,
                 Bucket=self.bucket_name,
                 Key=key,
             )
+            _metadata_cache.pop((self.bucket_name, key), None)
 
             self.logger.info(f"StorageClient . delete_file . Deleted file {key}")
 
@@ -144,7 +209,7 @@ class StorageClient:
             )
             raise
 
-    def file_exists(self, key: str) -> bool:
+    async def file_exists(self, key: str) -> bool:
         """
         Check if a file exists in R2 storage.
 
@@ -155,10 +220,7 @@ class StorageClient:
             True if file exists, False otherwise
         """
         try:
-            self.client.head_object(
-                Bucket=self.bucket_name,
-                Key=key,
-            )
+            await self._head(key)
             return True
         except ClientError as e:
             if e.response["Error"]["Code"] == "404":
@@ -168,7 +230,7 @@ class StorageClient:
             )
             raise
 
-    def get_file_metadata(self, key: str) -> dict:
+    async def get_file_metadata(self, key: str) -> dict:
         """
         Get metadata for a file in R2 storage.
 
@@ -182,21 +244,44 @@ class StorageClient:
             ClientError: If file doesn't exist or retrieval fails
         """
         try:
-            response = self.client.head_object(
-                Bucket=self.bucket_name,
-                Key=key,
-            )
-
-            return {
-                "content_type": response.get("ContentType"),
-                "content_length": response.get("ContentLength"),
-                "last_modified": response.get("LastModified"),
-                "metadata": response.get("Metadata", {}),
-                "etag": response.get("ETag"),
-            }
+            return dict(await self._head(key))
 
         except ClientError as e:
             self.logger.error(
                 f"StorageClient . get_file_metadata . Failed to get metadata for {key}: {str(e)}"
             )
             raise
+
+    async def _head(self, key: str) -> dict:
+        """
+        HEAD an object, serving repeat lookups from the metadata cache.
+
+        Args:
+            key: Object key (path) in the bucket
+
+        Returns:
+            Dictionary containing file metadata
+
+        Raises:
+            ClientError: If file doesn't exist or retrieval fails
+        """
+        cache_key = (self.bucket_name, key)
+        cached = _metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = await asyncio.to_thread(
+            self.client.head_object,
+            Bucket=self.bucket_name,
+            Key=key,
+        )
+
+        metadata = {
+            "content_type": response.get("ContentType"),
+            "content_length": response.get("ContentLength"),
+            "last_modified": response.get("LastModified"),
+            "metadata": response.get("Metadata", {}),
+            "etag": response.get("ETag"),
+        }
+        _metadata_cache[cache_key] = metadata
+        return metadata
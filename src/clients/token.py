@@ -1,4 +1,10 @@
-from datetime import datetime, timedelta, timezone
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import timedelta
+from functools import lru_cache
 from http import HTTPStatus
 from typing import Optional, Type, TypeVar
 from uuid import UUID
@@ -6,16 +12,35 @@ from uuid import UUID
 import jwt
 from fastapi import HTTPException
 
-from src.core.config import jwt_settings
+from src.core.config import get_jwt_settings
 from src.core.constants import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS
 from src.schemas.auth_schemas import AccessToken, RefreshToken, TokenBase
 
 T = TypeVar("T", bound=TokenBase)
 
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+REFRESH_TOKEN_EXPIRE_SECONDS = REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _numeric_claim(payload: dict, claim: str) -> int:
+    try:
+        return int(payload[claim])
+    # OverflowError covers non-finite JSON numbers such as 1e400 or Infinity
+    except (TypeError, ValueError, OverflowError):
+        raise jwt.DecodeError(f"The '{claim}' claim must be an integer")
+
 
 class JWTClient:
     def __init__(self):
-        self.secret_key = jwt_settings.secret_key
+        # encoded once so PyJWT does not re-encode the key on every call
+        self.secret_key = get_jwt_settings().secret_key.encode()
+        # keyed HMAC state that verification copies instead of re-deriving the key pads
+        self._hmac = hmac.new(self.secret_key, digestmod=hashlib.sha256)
 
     def create_access_token(
         self,
@@ -25,51 +50,130 @@ class JWTClient:
         expires_delta: Optional[timedelta] = None,
     ) -> str:
         """Create a JWT access token with session ID embedded"""
+        # claims are unix timestamps, so skip building datetimes for PyJWT to convert
+        now = int(time.time())
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            expire = now + int(expires_delta.total_seconds())
         else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            expire = now + ACCESS_TOKEN_EXPIRE_SECONDS
 
         payload = {
             "sub": str(user_id),
             "sessionId": str(session_id),
             "roles": roles,
             "exp": expire,
-            "iat": datetime.now(timezone.utc),
+            "iat": now,
             "type": "access",
         }
 
-        token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+        token = jwt.encode(payload, self.secret_key, algorithm=ALGORITHM)
         return token
 
     def create_refresh_token(
         self, user_id: UUID, session_id: UUID, expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create a JWT refresh token"""
+        now = int(time.time())
         if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
+            expire = now + int(expires_delta.total_seconds())
         else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                days=REFRESH_TOKEN_EXPIRE_DAYS
-            )
+            expire = now + REFRESH_TOKEN_EXPIRE_SECONDS
 
         payload = {
             "sub": str(user_id),
             "sessionId": str(session_id),
             "exp": expire,
-            "iat": datetime.now(timezone.utc),
+            "iat": now,
             "type": "refresh",
         }
 
-        token = jwt.encode(payload, self.secret_key, algorithm="HS256")
+        token = jwt.encode(payload, self.secret_key, algorithm=ALGORITHM)
         return token
 
+    def create_token_pair(
+        self, user_id: UUID, session_id: UUID, roles: list[str]
+    ) -> tuple[str, str]:
+        """Create an access and refresh token for the same session"""
+        # both tokens share the stringified ids and a single timestamp
+        now = int(time.time())
+        sub = str(user_id)
+        session = str(session_id)
+
+        access_token = jwt.encode(
+            {
+                "sub": sub,
+                "sessionId": session,
+                "roles": roles,
+                "exp": now + ACCESS_TOKEN_EXPIRE_SECONDS,
+                "iat": now,
+                "type": "access",
+            },
+            self.secret_key,
+            algorithm=ALGORITHM,
+        )
+        refresh_token = jwt.encode(
+            {
+                "sub": sub,
+                "sessionId": session,
+                "exp": now + REFRESH_TOKEN_EXPIRE_SECONDS,
+                "iat": now,
+                "type": "refresh",
+            },
+            self.secret_key,
+            algorithm=ALGORITHM,
+        )
+        return access_token, refresh_token
+
+    def _verify(self, token: str) -> dict:
+        """
+        Verify an HS256 token and return its claims.
+
+        Equivalent to jwt.decode for the tokens this client issues, without
+        PyJWT's generic algorithm dispatch. Raises the same PyJWT exceptions.
+        """
+        if token.count(".") != 2:
+            raise jwt.DecodeError("Not enough segments")
+
+        signing_input, _, signature_segment = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+
+        try:
+            header = json.loads(_b64url_decode(header_segment))
+            signature = _b64url_decode(signature_segment)
+        except ValueError:
+            raise jwt.DecodeError("Invalid header or signature padding")
+
+        if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+            raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+        mac = self._hmac.copy()
+        mac.update(signing_input.encode())
+        if not hmac.compare_digest(mac.digest(), signature):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+
+        try:
+            payload = json.loads(_b64url_decode(payload_segment))
+        except ValueError:
+            raise jwt.DecodeError("Invalid payload string")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+        now = time.time()
+        if "exp" not in payload:
+            raise jwt.MissingRequiredClaimError("exp")
+        if _numeric_claim(payload, "exp") <= now:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        if "iat" in payload and _numeric_claim(payload, "iat") > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+        if "nbf" in payload and _numeric_claim(payload, "nbf") > now:
+            raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+
+        return payload
+
     def decode_token(self, token: str, token_class: Type[T]) -> T:
         """Generic method to decode JWT tokens into AccessToken or RefreshToken"""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
+            payload = self._verify(token)
             return token_class(**payload)
         except jwt.ExpiredSignatureError:
             raise HTTPException(
@@ -87,3 +191,14 @@ class JWTClient:
     def decode_refresh_token(self, token: str) -> RefreshToken:
         """Decode a refresh token"""
         return self.decode_token(token, RefreshToken)
+
+
+@lru_cache(maxsize=1)
+def get_jwt_client() -> JWTClient:
+    """
+    JWTClient shared by the auth dependencies and services.
+
+    The client only holds the encoded key and its HMAC state, so one
+    instance can serve every request.
+    """
+    return JWTClient()
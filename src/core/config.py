@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -19,6 +20,10 @@ class Base(BaseSettings):
 
 class DatabaseSettings(Base):
     database_url: str = Field(validation_alias="DATABASE_URL")
+    pool_size: int = Field(validation_alias="DATABASE_POOL_SIZE", default=10)
+    max_overflow: int = Field(validation_alias="DATABASE_MAX_OVERFLOW", default=20)
+    pool_recycle: int = Field(validation_alias="DATABASE_POOL_RECYCLE", default=1800)
+    slow_query_ms: int = Field(validation_alias="DATABASE_SLOW_QUERY_MS", default=100)
 
 
 class EmailSettings(Base):
@@ -44,9 +49,32 @@ class JWTSettings(Base):
     secret_key: str = Field(validation_alias="SECRET_KEY")
 
 
-base_settings = Base()
-database_settings = DatabaseSettings()
-email_settings = EmailSettings()
-storage_settings = StorageSettings()
-maps_settings = MapsSettings()
-jwt_settings = JWTSettings()
+# Settings are read from the environment and .env on first use, once per process
+@lru_cache(maxsize=1)
+def get_base_settings() -> Base:
+    return Base()
+
+
+@lru_cache(maxsize=1)
+def get_database_settings() -> DatabaseSettings:
+    return DatabaseSettings()
+
+
+@lru_cache(maxsize=1)
+def get_email_settings() -> EmailSettings:
+    return EmailSettings()
+
+
+@lru_cache(maxsize=1)
+def get_storage_settings() -> StorageSettings:
+    return StorageSettings()
+
+
+@lru_cache(maxsize=1)
+def get_maps_settings() -> MapsSettings:
+    return MapsSettings()
+
+
+@lru_cache(maxsize=1)
+def get_jwt_settings() -> JWTSettings:
+    return JWTSettings()
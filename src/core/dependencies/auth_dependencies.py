@@ -1,10 +1,11 @@
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
 
 from src.clients.email import EmailClient
-from src.clients.token import JWTClient
-from src.core.config import email_settings
+from src.clients.token import get_jwt_client
+from src.core.config import get_email_settings
 from src.core.deps import T_Database
 from src.repositories.account_repository import AccountRepository
 from src.repositories.role_repository import RoleRepository
@@ -16,8 +17,16 @@ from src.repositories.verification_code_repository import VerificationCodeReposi
 from src.services.auth_service import AuthService
 
 
+@lru_cache(maxsize=1)
+def get_email_client() -> EmailClient:
+    email_settings = get_email_settings()
+    return EmailClient(
+        api_key=email_settings.resend_api_key, from_email=email_settings.from_email
+    )
+
+
 class AuthDependencies:
-    def __init__(self, db: T_Database):
+    def __init__(self, db: T_Database, background_tasks: BackgroundTasks):
         self.user_info_repository = UserInfoRepository(db)
         self.user_repository = UserRepository(db)
         self.role_repository = RoleRepository(db)
@@ -25,10 +34,8 @@ class AuthDependencies:
         self.user_to_role_repository = UserToRoleRepository(db)
         self.verification_code_repository = VerificationCodeRepository(db)
         self.session_repository = SessionRepository(db)
-        self.email_client = EmailClient(
-            api_key=email_settings.resend_api_key, from_email=email_settings.from_email
-        )
-        self.jwt_client = JWTClient()
+        self.email_client = get_email_client()
+        self.jwt_client = get_jwt_client()
         self.service = AuthService(
             account_repository=self.account_repository,
             user_repository=self.user_repository,
@@ -39,11 +46,14 @@ class AuthDependencies:
             email_client=self.email_client,
             jwt_client=self.jwt_client,
             user_info_repository=self.user_info_repository,
+            background_tasks=background_tasks,
         )
 
 
-def get_auth_deps(db: T_Database) -> AuthDependencies:
-    return AuthDependencies(db)
+def get_auth_deps(
+    db: T_Database, background_tasks: BackgroundTasks
+) -> AuthDependencies:
+    return AuthDependencies(db, background_tasks)
 
 
 T_AuthDeps = Annotated[AuthDependencies, Depends(get_auth_deps)]
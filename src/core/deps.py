@@ -2,45 +2,154 @@
 Global dependencies
 """
 
+import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
 from typing import Annotated
 from uuid import UUID
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import and_, bindparam, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.clients.token import JWTClient
+from src.clients.token import get_jwt_client
 from src.core.database import get_db
 from src.models.session import Session
 from src.models.user import User
+from src.schemas.auth_schemas import AccessToken
 from src.schemas.session_schemas import SessionSchema
 from src.schemas.user_schemas import UserSchema
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/sign-in")
 
-T_Database = Annotated[AsyncSession, Depends(get_db)]
+# function scope so the commit runs before the response is sent, not after
+T_Database = Annotated[AsyncSession, Depends(get_db, scope="function")]
+
+# Built once for the per-request auth lookups so each call only binds its ids
+_SESSION_BY_ID = select(Session.id, Session.expires_at, Session.user_id).where(
+    Session.id == bindparam("session_id")
+)
+# the outer join leaves the user columns null when only the user is missing
+_SESSION_USER_BY_ID = (
+    select(
+        Session.expires_at,
+        User.id,
+        User.first_name,
+        User.last_name,
+        User.email,
+        User.email_verified,
+        User.created_at,
+        User.updated_at,
+    )
+    .outerjoin(User, and_(User.id == Session.user_id, User.id == bindparam("user_id")))
+    .where(Session.id == bindparam("session_id"))
+)
+
+
+def _from_row[S: BaseModel](schema: type[S], row: object) -> S:
+    """Build a schema from a trusted database row without re-validating it"""
+    return schema.model_construct(
+        **{name: getattr(row, name) for name in schema.model_fields}
+    )
+
+
+# Verified access token payloads keyed by the token's SHA-256, so a client
+# reusing its token skips signature checks and parsing for a short while
+_access_token_cache: TTLCache[bytes, AccessToken] = TTLCache(maxsize=10_000, ttl=30)
+
+
+def decode_access_token(token: str) -> AccessToken:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _access_token_cache.get(key)
+    # a cached token can still expire inside the TTL window
+    if payload is not None and payload.exp > datetime.now(timezone.utc):
+        return payload
+
+    payload = get_jwt_client().decode_access_token(token)
+    _access_token_cache[key] = payload
+    return payload
+
+
+# Sessions and their authenticated users keyed by session id. Each worker
+# holds its own copy, so a sign-out or user change handled by another worker
+# is only seen here once the TTL lapses
+_session_cache: TTLCache[UUID, SessionSchema] = TTLCache(maxsize=10_000, ttl=15)
+_session_user_cache: TTLCache[UUID, tuple[UserSchema, datetime]] = TTLCache(
+    maxsize=5000, ttl=30
+)
+
+
+# Bumped on every eviction so a lookup that read its row before a concurrent
+# commit does not put the stale row back into the cache afterwards
+_cache_generation = 0
+
+
+def invalidate_session(db: AsyncSession, session_id: UUID) -> None:
+    """Evict a session from the caches once db's transaction commits"""
+    db.info.setdefault("invalidated_session_ids", set()).add(session_id)
+
+
+def invalidate_user(db: AsyncSession, user_id: UUID) -> None:
+    """Evict every cached session of a user once db's transaction commits"""
+    db.info.setdefault("invalidated_user_ids", set()).add(user_id)
+
+
+# Evicting before the commit would let a concurrent request re-cache the
+# still committed old row, so the evictions wait for the commit
+@event.listens_for(AsyncSession.sync_session_class, "after_commit")
+def _evict_invalidated(db) -> None:
+    global _cache_generation
+
+    session_ids = db.info.pop("invalidated_session_ids", set())
+    user_ids = db.info.pop("invalidated_user_ids", set())
+    if not session_ids and not user_ids:
+        return
+
+    _cache_generation += 1
+    for session_id, session in list(_session_cache.items()):
+        if session_id in session_ids or session.user_id in user_ids:
+            _session_cache.pop(session_id, None)
+    for session_id, (user, _) in list(_session_user_cache.items()):
+        if session_id in session_ids or user.id in user_ids:
+            _session_user_cache.pop(session_id, None)
+
+
+@event.listens_for(AsyncSession.sync_session_class, "after_soft_rollback")
+def _discard_invalidated(db, previous_transaction) -> None:
+    # a rolled back savepoint leaves the outer transaction's changes in place
+    if previous_transaction.nested:
+        return
+    db.info.pop("invalidated_session_ids", None)
+    db.info.pop("invalidated_user_ids", None)
 
 
 async def get_session(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: T_Database,
 ) -> SessionSchema:
-    token_client = JWTClient()
-    payload = token_client.decode_access_token(token)
+    payload = decode_access_token(token)
 
-    session_id = UUID(payload.sessionId)
-    result = await db.execute(select(Session).where(Session.id == session_id))
-    session = result.scalar_one_or_none()
+    session_id = payload.sessionId
+    cached = _session_cache.get(session_id)
+    if cached is not None:
+        return cached
+
+    generation = _cache_generation
+    result = await db.execute(_SESSION_BY_ID, {"session_id": session_id})
+    session = result.one_or_none()
 
     if not session:
         raise HTTPException(
             status_code=HTTPStatus.UNAUTHORIZED, detail="Session not found"
         )
 
-    return SessionSchema.model_validate(session)
+    session_schema = _from_row(SessionSchema, session)
+    if generation == _cache_generation:
+        _session_cache[session_id] = session_schema
+    return session_schema
 
 
 T_Session = Annotated[SessionSchema, Depends(get_session)]
@@ -50,35 +159,43 @@ async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: T_Database,
 ) -> UserSchema:
-    token_client = JWTClient()
-    payload = token_client.decode_access_token(token)
+    payload = decode_access_token(token)
+
+    session_id = payload.sessionId
+    user_id = payload.sub
 
-    # we should check if the session is even valid first
-    session = await db.execute(
-        select(Session).where(Session.id == UUID(payload.sessionId))
+    cached = _session_user_cache.get(session_id)
+    if cached is not None:
+        cached_user, expires_at = cached
+        if cached_user.id == user_id and expires_at >= datetime.now(timezone.utc):
+            return cached_user
+
+    generation = _cache_generation
+    # fetch the session expiry and its user's columns in one round trip
+    result = await db.execute(
+        _SESSION_USER_BY_ID, {"session_id": session_id, "user_id": user_id}
     )
-    session = session.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not session:
+    if not row:
         raise HTTPException(
             status_code=HTTPStatus.UNAUTHORIZED, detail="Session not found"
         )
 
-    if session.expires_at < datetime.now(timezone.utc):
+    if row.expires_at < datetime.now(timezone.utc):
         raise HTTPException(
             status_code=HTTPStatus.UNAUTHORIZED, detail="Session expired"
         )
 
-    user_id = UUID(payload.sub)
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
+    if row.id is None:
         raise HTTPException(
             status_code=HTTPStatus.UNAUTHORIZED, detail="User not found"
         )
 
-    return UserSchema.model_validate(user)
+    user_schema = _from_row(UserSchema, row)
+    if generation == _cache_generation:
+        _session_user_cache[session_id] = (user_schema, row.expires_at)
+    return user_schema
 
 
 T_CurrentUser = Annotated[UserSchema, Depends(get_current_user)]
@@ -1,8 +1,9 @@
-import json
 import logging
 import sys
 from datetime import datetime, timezone
 
+import orjson
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -10,11 +11,19 @@ class JSONFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
+        # most calls pass a plain string, which needs no %-formatting
+        if not record.args and isinstance(record.msg, str):
+            message = record.msg
+        else:
+            message = record.getMessage()
+
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            # record.created is set when the record is made, so there is no
+            # second clock read; orjson renders the UTC datetime with a "Z"
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -24,7 +33,7 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, option=orjson.OPT_UTC_Z).decode()
 
 
 def setup_logger(name: str = "app") -> logging.Logger:
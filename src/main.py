@@ -1,16 +1,24 @@
-from contextlib import asynccontextmanager
+import asyncio
+import gzip
+from contextlib import asynccontextmanager, suppress
 from time import perf_counter
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from scalar_fastapi import get_scalar_api_reference
-from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 
-from src.core.config import base_settings
-from src.core.database import AsyncSessionLocal
+from src.core.config import get_base_settings
+from src.core.constants import EXPIRED_ROWS_PURGE_INTERVAL_SECONDS
+from src.core.database import AsyncSessionLocal, engine, warm_pool
 from src.core.logger import setup_logger
 from src.models.role import Role
 from src.models.specialty import Specialty, SpecialtyCategoryEnum
+from src.repositories.session_repository import SessionRepository
+from src.repositories.verification_code_repository import (
+    VerificationCodeRepository,
+)
 from src.routes.auth_router import router as auth_router
 from src.routes.contact_router import router as contact_router
 from src.routes.user_router import router as user_router
@@ -19,63 +27,79 @@ from src.routes.waitlist_router import router as waitlist_router
 logger = setup_logger()
 
 
+async def purge_expired_rows():
+    """Periodically delete expired sessions and verification codes so the
+    tables and their indexes only hold live rows"""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                sessions = await SessionRepository(db).delete_expired_sessions()
+                codes = await VerificationCodeRepository(
+                    db
+                ).delete_expired_verification_codes()
+                await db.commit()
+            logger.info(
+                "purged %s expired sessions and %s expired verification codes",
+                sessions,
+                codes,
+            )
+        except Exception:
+            logger.exception("Error purging expired rows")
+
+        await asyncio.sleep(EXPIRED_ROWS_PURGE_INTERVAL_SECONDS)
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     logger.info("starting server")
 
     async with AsyncSessionLocal() as db:
         try:
-            # Seed roles
-            logger.info("checking roles")
-            get_roles_statement = select(Role)
-            result = await db.execute(get_roles_statement)
-            existing_roles = list(result.scalars().all())
-
-            if len(existing_roles) == 0:
-                logger.info("seeding roles")
-                roles_to_insert = [
-                    Role(name="admin"),
-                    Role(name="careseeker"),
-                    Role(name="caregiver"),
-                ]
-                db.add_all(roles_to_insert)
-                await db.commit()
-
-            # Seed specialties
-            logger.info("checking specialties")
-            get_specialties_statement = select(Specialty)
-            result = await db.execute(get_specialties_statement)
-            existing_specialties = list(result.scalars().all())
-
-            if len(existing_specialties) == 0:
-                logger.info("seeding specialties")
-                specialties_to_insert = [
-                    Specialty(
-                        category=SpecialtyCategoryEnum.CHILD_CARE,
-                        description="Child care",
-                    ),
-                    Specialty(
-                        category=SpecialtyCategoryEnum.SENIOR_CARE,
-                        description="Senior care",
-                    ),
-                    Specialty(
-                        category=SpecialtyCategoryEnum.HOUSEKEEPING,
-                        description="Housekeeping",
-                    ),
-                    Specialty(
-                        category=SpecialtyCategoryEnum.PET_CARE,
-                        description="Pet care",
-                    ),
-                    Specialty(
-                        category=SpecialtyCategoryEnum.TUTORING,
-                        description="Tutoring",
-                    ),
-                    Specialty(
-                        category=SpecialtyCategoryEnum.OTHER, description="Other"
-                    ),
-                ]
-                db.add_all(specialties_to_insert)
-                await db.commit()
+            # Seeding is idempotent on the unique role name and specialty
+            # category, so workers starting together cannot insert duplicates
+            logger.info("seeding roles")
+            await db.execute(
+                insert(Role)
+                .values(
+                    [{"name": "admin"}, {"name": "careseeker"}, {"name": "caregiver"}]
+                )
+                .on_conflict_do_nothing(index_elements=[Role.name])
+            )
+
+            logger.info("seeding specialties")
+            await db.execute(
+                insert(Specialty)
+                .values(
+                    [
+                        {
+                            "category": SpecialtyCategoryEnum.CHILD_CARE,
+                            "description": "Child care",
+                        },
+                        {
+                            "category": SpecialtyCategoryEnum.SENIOR_CARE,
+                            "description": "Senior care",
+                        },
+                        {
+                            "category": SpecialtyCategoryEnum.HOUSEKEEPING,
+                            "description": "Housekeeping",
+                        },
+                        {
+                            "category": SpecialtyCategoryEnum.PET_CARE,
+                            "description": "Pet care",
+                        },
+                        {
+                            "category": SpecialtyCategoryEnum.TUTORING,
+                            "description": "Tutoring",
+                        },
+                        {
+                            "category": SpecialtyCategoryEnum.OTHER,
+                            "description": "Other",
+                        },
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[Specialty.category])
+            )
+            await db.commit()
 
             logger.info("seeding complete")
         except Exception as e:
@@ -83,32 +107,56 @@ async def lifespan(_: FastAPI):
             logger.exception(f"Error seeding database: {e}")
             raise
 
+    logger.info("warming connection pool")
+    await warm_pool()
+
+    purge_task = asyncio.create_task(purge_expired_rows())
+
     yield
 
     logger.info("shutting down")
+    purge_task.cancel()
+    # let a purge that is mid-DELETE unwind before its connection is disposed
+    with suppress(asyncio.CancelledError):
+        await purge_task
+    # close pooled connections cleanly instead of leaving Postgres to time them out
+    await engine.dispose()
 
 
-app = FastAPI(lifespan=lifespan, root_path="/api")
+app = FastAPI(
+    lifespan=lifespan, root_path="/api", default_response_class=ORJSONResponse
+)
+
+
+UNLOGGED_PATHS = frozenset({"/healthcheck", "/scalar"})
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
+    # probes and the docs page would only add noise to the request log
+    path = request.scope["path"].removeprefix(request.scope.get("root_path", ""))
+    if path in UNLOGGED_PATHS:
+        return await call_next(request)
+
     start = perf_counter()
 
-    logger.info(f"Request: {request.method} {request.url.path}")
+    logger.info("Request: %s %s", request.method, request.url.path)
 
     response = await call_next(request)
 
     elapsed_ms = (perf_counter() - start) * 1000
     logger.info(
-        f"Response: {request.method} {request.url.path} "
-        + f"Status: {response.status_code} Duration: {elapsed_ms:.2f}ms"
+        "Response: %s %s Status: %d Duration: %.2fms",
+        request.method,
+        request.url.path,
+        response.status_code,
+        elapsed_ms,
     )
 
     return response
 
 
-origins = [base_settings.base_url]
+origins = [get_base_settings().base_url]
 
 app.add_middleware(
     CORSMiddleware,
@@ -119,18 +167,37 @@ app.add_middleware(
 )
 
 
+# Serialised once; a new Response is still built per request because
+# middleware appends headers to the response it is handed
+_HEALTHCHECK_BODY = b'{"Hello":"World"}'
+
+
 @app.get("/healthcheck")
-def read_root():
-    return {"Hello": "World"}
+async def read_root():
+    # short enough that a proxy answering repeat probes still notices an outage
+    return Response(
+        _HEALTHCHECK_BODY,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=10"},
+    )
+
+
+# The docs page is static per process, so render and compress it once
+_SCALAR_HTML = get_scalar_api_reference(
+    openapi_url=app.openapi_url,
+    scalar_proxy_url="https://proxy.scalar.com",
+    title="Millennicare API docs",
+).body
+_SCALAR_HTML_GZIP = gzip.compress(_SCALAR_HTML)
 
 
 @app.get("/scalar", include_in_schema=False)
-async def scalar_html():
-    return get_scalar_api_reference(
-        openapi_url=app.openapi_url,
-        scalar_proxy_url="https://proxy.scalar.com",
-        title="Millennicare API docs",
-    )
+async def scalar_html(request: Request):
+    headers = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(_SCALAR_HTML_GZIP, media_type="text/html", headers=headers)
+    return Response(_SCALAR_HTML, media_type="text/html", headers=headers)
 
 
 app.include_router(auth_router)
@@ -145,5 +212,5 @@ if __name__ == "__main__":
         "src.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=base_settings.env != "development",
+        reload=get_base_settings().env != "development",
     )
@@ -1,23 +1,23 @@
 import uuid
 
-from sqlalchemy import UUID, ForeignKey, Integer, String
+from sqlalchemy import UUID, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
-class Account(Base):
+class Account(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "account"
-
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
+    __table_args__ = (
+        Index("ix_account_user_id_provider_id", "user_id", "provider_id", unique=True),
     )
+
     account_id: Mapped[str] = mapped_column(String)
     provider_id: Mapped[str] = mapped_column(String)
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
-        index=True,
     )
     access_token: Mapped[str | None] = mapped_column(String)
     refresh_token: Mapped[str | None] = mapped_column(String)
@@ -6,6 +6,7 @@ from sqlalchemy import UUID, DateTime, Enum, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
 class AppointmentStatusEnum(enum.Enum):
@@ -15,12 +16,9 @@ class AppointmentStatusEnum(enum.Enum):
     CANCELLED = "cancelled"
 
 
-class Appointment(Base):
+class Appointment(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "appointment"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     start_time: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
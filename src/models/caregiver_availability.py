@@ -5,14 +5,12 @@ from sqlalchemy import UUID, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
-class CaregiverAvailability(Base):
+class CaregiverAvailability(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "caregiver_availability"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     caregiver_id: Mapped[uuid.UUID] = mapped_column(
         UUID, ForeignKey("caregiver_information.user_id"), nullable=False
     )
@@ -1,11 +1,12 @@
 import enum
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import UUID, DateTime, Enum, ForeignKey, String
+from sqlalchemy import UUID, DateTime, Enum, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDv7PrimaryKeyMixin
 
 
 class ContactPriorityEnum(enum.Enum):
@@ -22,14 +23,12 @@ class ContactStatusEnum(enum.Enum):
     CLOSED = "closed"
 
 
-class Contact(Base):
+class Contact(UUIDv7PrimaryKeyMixin, Base):
     __tablename__ = "contact"
+    __table_args__ = (Index("ix_contact_created_at_id", "created_at", "id"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     full_name: Mapped[str] = mapped_column(String, nullable=False)
-    email: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(String(320), nullable=False, index=True)
     message: Mapped[str] = mapped_column(String, nullable=False)
     status: Mapped[ContactStatusEnum] = mapped_column(
         Enum(ContactStatusEnum), nullable=False, default=ContactStatusEnum.PENDING
@@ -40,7 +39,7 @@ class Contact(Base):
     submitted_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        default=datetime.now(timezone.utc),
+        server_default=func.now(),
     )
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID,
@@ -1,10 +1,14 @@
 import enum
 import uuid
+from typing import Any
 
-from sqlalchemy import UUID, Enum, ForeignKey, Integer, String
+from sqlalchemy import UUID, Enum, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
 class DependentTypeEnum(enum.Enum):
@@ -13,12 +17,38 @@ class DependentTypeEnum(enum.Enum):
     SENIOR = "senior"
 
 
-class Dependent(Base):
-    __tablename__ = "dependent"
+class PetDependentSpeciesEnum(enum.Enum):
+    CAT = "cat"
+    DOG = "dog"
+    BIRD = "bird"
+    FISH = "fish"
+    REPTILE = "reptile"
+    OTHER = "other"
+
+
+class ChildGenderEnum(enum.Enum):
+    MALE = "male"
+    FEMALE = "female"
+
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
+class SeniorDependentGenderEnum(enum.Enum):
+    MALE = "male"
+    FEMALE = "female"
+    OTHER = "other"
+    PREFER_NOT_TO_SAY = "prefer_not_to_say"
+
+
+class Dependent(UUIDPrimaryKeyMixin, Base):
+    __tablename__ = "dependent"
+    __table_args__ = (
+        Index(
+            "ix_dependent_attributes",
+            "attributes",
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"},
+        ),
     )
+
     name: Mapped[str] = mapped_column(String, nullable=False)
     type: Mapped[DependentTypeEnum] = mapped_column(
         Enum(DependentTypeEnum), nullable=False
@@ -32,3 +62,34 @@ class Dependent(Base):
         nullable=False,
         index=True,
     )
+    # type specific fields, e.g. {"species": "dog"} or {"gender": "female"}
+    attributes: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+
+    @hybrid_property
+    def species(self) -> PetDependentSpeciesEnum | None:
+        value = self.attributes.get("species")
+        return PetDependentSpeciesEnum(value) if value is not None else None
+
+    @species.inplace.expression
+    @classmethod
+    def _species_expression(cls):
+        return cls.attributes["species"].astext
+
+    @hybrid_property
+    def gender(self) -> ChildGenderEnum | SeniorDependentGenderEnum | None:
+        value = self.attributes.get("gender")
+        if value is None:
+            return None
+        if self.type == DependentTypeEnum.CHILD:
+            return ChildGenderEnum(value)
+        return SeniorDependentGenderEnum(value)
+
+    @gender.inplace.expression
+    @classmethod
+    def _gender_expression(cls):
+        return cls.attributes["gender"].astext
+
+    def __repr__(self) -> str:
+        return f"<Dependent(id={self.id}, name={self.name}, type={self.type}, age={self.age}, careseeker_id={self.careseeker_id}, attributes={self.attributes})>"
@@ -4,14 +4,12 @@ from sqlalchemy import UUID, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
-class Location(Base):
+class Location(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "location"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID,
         ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
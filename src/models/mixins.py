@@ -0,0 +1,17 @@
+import uuid
+
+from sqlalchemy import UUID, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class UUIDPrimaryKeyMixin:
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID, primary_key=True, server_default=func.gen_random_uuid(), sort_order=-1
+    )
+
+
+class UUIDv7PrimaryKeyMixin:
+    # time ordered, so inserts land on the right edge of the primary key index
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID, primary_key=True, server_default=func.uuidv7(), sort_order=-1
+    )
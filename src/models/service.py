@@ -5,6 +5,7 @@ from sqlalchemy import UUID, Enum, Float, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
 class ServiceCategoryEnum(enum.Enum):
@@ -22,12 +23,9 @@ class ServicePricingTypeEnum(enum.Enum):
     PER_JOB = "per_job"
 
 
-class Service(Base):
+class Service(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "service"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     title: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=False)
     price: Mapped[float] = mapped_column(Float)
@@ -5,14 +5,12 @@ from sqlalchemy import UUID, DateTime, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDv7PrimaryKeyMixin
 
 
-class Session(Base):
+class Session(UUIDv7PrimaryKeyMixin, Base):
     __tablename__ = "session"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
@@ -1,10 +1,10 @@
 import enum
-import uuid
 
-from sqlalchemy import UUID, Enum, String
+from sqlalchemy import Enum, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 
 class SpecialtyCategoryEnum(enum.Enum):
@@ -16,15 +16,12 @@ class SpecialtyCategoryEnum(enum.Enum):
     OTHER = "other"
 
 
-class Specialty(Base):
+class Specialty(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "specialty"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     description: Mapped[str] = mapped_column(String)
     category: Mapped[SpecialtyCategoryEnum] = mapped_column(
-        Enum(SpecialtyCategoryEnum), nullable=False, index=True
+        Enum(SpecialtyCategoryEnum), nullable=False, index=True, unique=True
     )
 
     def __repr__(self) -> str:
@@ -1,27 +1,31 @@
-import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, Boolean, String
+from sqlalchemy import Boolean, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 if TYPE_CHECKING:
     from src.models.user_information import UserInformation
 
 
-class User(Base):
+class User(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "user"
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     first_name: Mapped[str] = mapped_column(String, nullable=False)
     last_name: Mapped[str] = mapped_column(String, nullable=False)
-    email: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    email: Mapped[str] = mapped_column(String(320), nullable=False)
     email_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
-    user_info: Mapped["UserInformation"] = relationship(back_populates="user")
+    user_info: Mapped["UserInformation"] = relationship(
+        back_populates="user", lazy="raise_on_sql"
+    )
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, email_verified={self.email_verified}, first_name={self.first_name}, last_name={self.last_name})>"
+
+
+# Emails are matched case-insensitively, so uniqueness is enforced on lower(email)
+Index("ix_user_email_lower", func.lower(User.email), unique=True)
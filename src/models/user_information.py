@@ -7,6 +7,7 @@ from sqlalchemy import UUID, DateTime, Enum, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.models.mixins import UUIDPrimaryKeyMixin
 
 if TYPE_CHECKING:
     from src.models.user import User
@@ -19,12 +20,9 @@ class UserGenderEnum(enum.Enum):
     PREFER_NOT_TO_SAY = "prefer_not_to_say"
 
 
-class UserInformation(Base):
+class UserInformation(UUIDPrimaryKeyMixin, Base):
     __tablename__ = "user_information"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID,
         ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
@@ -36,7 +34,7 @@ class UserInformation(Base):
     birthdate: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     gender: Mapped[UserGenderEnum] = mapped_column(Enum(UserGenderEnum), nullable=False)
 
-    user: Mapped["User"] = relationship(back_populates="user_info")
+    user: Mapped["User"] = relationship(back_populates="user_info", lazy="raise_on_sql")
 
     def __repr__(self) -> str:
         return f"<UserInformation(id={self.id}, user_id={self.user_id}, phone_number={self.phone_number}, birthdate={self.birthdate}, gender={self.gender})>"
@@ -2,10 +2,11 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID, DateTime, Enum, ForeignKey, String
+from sqlalchemy import UUID, DateTime, Enum, ForeignKey, Index, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDv7PrimaryKeyMixin
 
 
 class VerificationCodeEnum(enum.Enum):
@@ -13,12 +14,13 @@ class VerificationCodeEnum(enum.Enum):
     VERIFY_EMAIL = "verify_email"
 
 
-class VerificationCode(Base):
+class VerificationCode(UUIDv7PrimaryKeyMixin, Base):
     __tablename__ = "verification_code"
-
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
+    __table_args__ = (
+        Index("ix_verification_code_user_id_identifier", "user_id", "identifier"),
+        Index("ix_verification_code_token", "token", postgresql_using="hash"),
     )
+
     value: Mapped[str] = mapped_column(String, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
@@ -27,12 +29,12 @@ class VerificationCode(Base):
         UUID,
         ForeignKey("user.id", ondelete="CASCADE", onupdate="CASCADE"),
         nullable=False,
-        index=True,
     )
     identifier: Mapped[VerificationCodeEnum] = mapped_column(
         Enum(VerificationCodeEnum), nullable=False
     )
-    token: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    # sha256 digest of the token sent in the email link, never the token itself
+    token: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
 
     def __repr__(self) -> str:
         return f"<Verificationcode(id={self.id}, value={self.value}, expires_at={self.expires_at}, user_id={self.user_id}, identifier={self.identifier}, token={self.token})>"
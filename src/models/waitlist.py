@@ -1,20 +1,17 @@
-import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID, Boolean, DateTime, String
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.models.mixins import UUIDv7PrimaryKeyMixin
 
 
-class Waitlist(Base):
+class Waitlist(UUIDv7PrimaryKeyMixin, Base):
     __tablename__ = "waitlist"
 
-    id: Mapped[uuid.UUID] = mapped_column(
-        UUID, primary_key=True, default=lambda: uuid.uuid4()
-    )
     name: Mapped[str] = mapped_column(String, nullable=False)
-    email: Mapped[str] = mapped_column(String, nullable=False, index=True, unique=True)
+    email: Mapped[str] = mapped_column(String(320), nullable=False)
     contacted: Mapped[bool] = mapped_column(Boolean, default=False)
     referral_code: Mapped[str] = mapped_column(String, nullable=True)
     notified_at: Mapped[datetime] = mapped_column(
@@ -23,3 +20,6 @@ class Waitlist(Base):
 
     def __repr__(self) -> str:
         return f"<Waitlist(id={self.id}, name={self.name}, email={self.email}, contacted={self.contacted}, referral_code={self.referral_code}, notified_at={self.notified_at})>"
+
+
+Index("ix_waitlist_email_lower", func.lower(Waitlist.email), unique=True)
@@ -1,14 +1,15 @@
-from time import perf_counter
+from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import bindparam, insert, select, update
 
 from src.core.deps import T_Database
-from src.core.logger import setup_logger
 from src.models.account import Account
 from src.schemas.account_schemas import CreateAccountSchema
 
-logger = setup_logger(name=__name__)
+# Built once so each call only binds user_id; the compiled form is reused
+# from the engine's statement cache
+GET_ACCOUNTS_BY_USER_ID = select(Account).where(Account.user_id == bindparam("user_id"))
 
 
 class AccountRepository:
@@ -16,38 +17,20 @@ class AccountRepository:
         self.db = db
 
     async def create_account(self, values: CreateAccountSchema) -> None:
-        start = perf_counter()
-
         statement = insert(Account).values(**values.model_dump())
         await self.db.execute(statement)
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"AccountRepository.create_account took {elapsed_ms:.2f}ms")
-
-    async def get_accounts_by_user_id(self, user_id: UUID) -> list[Account]:
-        start = perf_counter()
+    async def get_accounts_by_user_id(self, user_id: UUID) -> Sequence[Account]:
+        result = await self.db.scalars(GET_ACCOUNTS_BY_USER_ID, {"user_id": user_id})
 
-        statement = select(Account).where(Account.user_id == user_id)
-        result = await self.db.scalars(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(
-            f"AccountRepository.get_accounts_by_user_id took {elapsed_ms:.2f}ms"
-        )
-
-        return list(result.all())
+        return result.all()
 
     async def update_account(
         self, user_id: UUID, provider_id: str, values: dict
     ) -> None:
-        start = perf_counter()
-
         statement = (
             update(Account)
-            .where(Account.user_id == user_id and Account.provider_id == provider_id)
+            .where(Account.user_id == user_id, Account.provider_id == provider_id)
             .values(**values)
         )
         await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"AccountRepository.update_account took {elapsed_ms:.2f}ms")
@@ -1,42 +1,50 @@
-from time import perf_counter
+from collections.abc import Iterable, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select
 
 from src.core.deps import T_Database
-from src.core.logger import setup_logger
 from src.models.role import Role
 from src.models.user_to_role import user_to_role
+from src.schemas.role_schemas import RoleSchema
 
-logger = setup_logger(__name__)
+# Roles are only written by the startup seed, so they are shared across
+# requests as frozen schemas rather than ORM instances tied to one session
+_roles_by_name: TTLCache[str, RoleSchema] = TTLCache(maxsize=64, ttl=60)
+
+GET_ROLES_BY_USER_ID = (
+    select(Role)
+    .join(user_to_role, user_to_role.c.role_id == Role.id)
+    .where(user_to_role.c.user_id == bindparam("user_id"))
+)
 
 
 class RoleRepository:
     def __init__(self, db: T_Database):
         self.db = db
 
-    async def get_role_by_name(self, name: str) -> Role | None:
-        start = perf_counter()
-
-        statement = select(Role).where(Role.name == name)
-        result = await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"RoleRepository.get_role_by_name took {elapsed_ms:.2f}ms")
-
-        return result.scalar_one_or_none()
-
-    async def get_roles_by_user_id(self, user_id: UUID) -> list[Role]:
-        start = perf_counter()
-
-        statement = (
-            select(Role)
-            .join(user_to_role, user_to_role.c.role_id == Role.id)
-            .where(user_to_role.c.user_id == user_id)
-        )
-        result = await self.db.scalars(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"RoleRepository.get_roles_by_user_id took {elapsed_ms:.2f}ms")
-
-        return list(result.all())
+    async def get_roles_by_names(self, names: Iterable[str]) -> list[RoleSchema]:
+        roles = {}
+        missing = []
+        for name in names:
+            role = _roles_by_name.get(name)
+            if role is None:
+                missing.append(name)
+            else:
+                roles[name] = role
+
+        if missing:
+            statement = select(Role.id, Role.name).where(Role.name.in_(missing))
+            result = await self.db.execute(statement)
+            for row in result:
+                role = RoleSchema.model_validate(row)
+                _roles_by_name[role.name] = role
+                roles[role.name] = role
+
+        return list(roles.values())
+
+    async def get_roles_by_user_id(self, user_id: UUID) -> Sequence[Role]:
+        result = await self.db.scalars(GET_ROLES_BY_USER_ID, {"user_id": user_id})
+
+        return result.all()
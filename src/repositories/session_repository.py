@@ -1,56 +1,46 @@
-from time import perf_counter
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import bindparam, delete, func, insert, select, update
 
-from src.core.deps import T_Database
-from src.core.logger import setup_logger
+from src.core.deps import T_Database, invalidate_session, invalidate_user
 from src.models.session import Session
 from src.schemas.session_schemas import CreateSessionSchema
 
-logger = setup_logger(__name__)
+GET_SESSION_BY_ID = select(Session).where(Session.id == bindparam("session_id"))
 
 
 class SessionRepository:
     def __init__(self, db: T_Database):
         self.db = db
 
-    async def create_session(self, values: CreateSessionSchema) -> Session:
-        start = perf_counter()
-
-        statement = insert(Session).values(**values.model_dump()).returning(Session)
+    async def create_session(self, values: CreateSessionSchema) -> UUID:
+        statement = insert(Session).values(**values.model_dump()).returning(Session.id)
         result = await self.db.execute(statement)
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"SessionRepository.create_session took {elapsed_ms:.2f}ms")
-
         return result.scalar_one()
 
     async def get_session_by_id(self, session_id) -> Session | None:
-        start = perf_counter()
-
-        statement = select(Session).where(Session.id == session_id)
-        result = await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"SessionRepository.get_session_by_id took {elapsed_ms:.2f}ms")
+        result = await self.db.execute(GET_SESSION_BY_ID, {"session_id": session_id})
 
         return result.scalar_one_or_none()
 
     async def update_session(self, session_id: UUID, values: dict) -> None:
-        start = perf_counter()
-
         statement = update(Session).where(Session.id == session_id).values(**values)
         await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"SessionRepository.update_session took {elapsed_ms:.2f}ms")
+        invalidate_session(self.db, session_id)
 
     async def delete_session(self, session_id: UUID) -> None:
-        start = perf_counter()
-
         statement = delete(Session).where(Session.id == session_id)
         await self.db.execute(statement)
+        invalidate_session(self.db, session_id)
+
+    async def delete_sessions_by_user_id(self, user_id: UUID) -> None:
+        statement = delete(Session).where(Session.user_id == user_id)
+        await self.db.execute(statement)
+        invalidate_user(self.db, user_id)
+
+    async def delete_expired_sessions(self) -> int:
+        statement = delete(Session).where(Session.expires_at < func.now())
+        result = await self.db.execute(statement)
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(f"SessionRepository.delete_session took {elapsed_ms:.2f}ms")
+        return result.rowcount
@@ -1,99 +1,103 @@
-from time import perf_counter
+from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select, update
-from sqlalchemy.orm import joinedload
-
-from src.core.deps import T_Database
-from src.core.logger import setup_logger
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+    update,
+)
+
+from src.core.deps import T_Database, invalidate_user
+from src.models.account import Account
+from src.models.role import Role
 from src.models.user import User
+from src.models.user_to_role import user_to_role
 from src.schemas.user_schemas import CreateUserSchema
 
+GET_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+GET_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"))
+
 
 class UserRepository:
     def __init__(self, db: T_Database):
         self.db = db
-        self.logger = setup_logger(name=__name__)
 
     async def get_user(self, user_id: UUID) -> User | None:
-        start = perf_counter()
-
-        statement = select(User).where(User.id == user_id)
-        result = await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(f"UserRepository.get_user took {elapsed_ms:.2f}ms")
-
-        return result.scalar_one_or_none()
-
-    async def get_user_with_information(self, user_id: UUID) -> User | None:
-        start = perf_counter()
-
-        statement = (
-            select(User).options(joinedload(User.user_info)).where(User.id == user_id)
-        )
-        result = await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(
-            f"UserRepository.get_user_with_information took {elapsed_ms:.2f}ms"
-        )
+        result = await self.db.execute(GET_USER_BY_ID, {"user_id": user_id})
 
         return result.scalar_one_or_none()
 
     async def create_user(self, values: CreateUserSchema) -> User:
-        start = perf_counter()
-
         statement = insert(User).values(**values.model_dump()).returning(User)
         result = await self.db.execute(statement)
-        await self.db.commit()
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(f"UserRepository.create_user took {elapsed_ms:.2f}ms")
 
         return result.scalar_one()
 
     async def get_user_by_email(self, email: str) -> User | None:
-        start = perf_counter()
+        result = await self.db.execute(GET_USER_BY_EMAIL, {"email": email.lower()})
 
-        statement = select(User).where(User.email == email)
-        result = await self.db.execute(statement)
+        return result.scalar_one_or_none()
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(f"UserRepository.get_user_by_email took {elapsed_ms:.2f}ms")
+    async def get_user_for_sign_in(
+        self, email: str
+    ) -> tuple[User, str | None, list[str]] | None:
+        """The user, their credentials password hash and role names in one
+        round trip"""
+        statement = (
+            select(
+                User,
+                Account.password,
+                func.array_remove(func.array_agg(Role.name), None),
+            )
+            .outerjoin(
+                Account,
+                and_(Account.user_id == User.id, Account.provider_id == "credentials"),
+            )
+            .outerjoin(user_to_role, user_to_role.c.user_id == User.id)
+            .outerjoin(Role, Role.id == user_to_role.c.role_id)
+            .where(func.lower(User.email) == email.lower())
+            .group_by(User.id, Account.password)
+        )
+        result = await self.db.execute(statement)
+        row = result.one_or_none()
 
-        return result.scalar_one_or_none()
+        return None if row is None else (row[0], row[1], row[2])
 
     async def delete_user(self, id: UUID) -> None:
-        start = perf_counter()
-
         statement = delete(User).where(User.id == id)
         await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(f"UserRepository.delete_user took {elapsed_ms:.2f}ms")
-
-    async def get_users(self, skip: int, limit: int) -> list[User]:
-        start = perf_counter()
-
-        statement = select(User).limit(limit).offset(skip)
+        invalidate_user(self.db, id)
+
+    async def get_users(
+        self, skip: int, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> Sequence[User]:
+        """Newest first. Passing the (created_at, id) of the last user of the
+        previous page as after seeks straight to the next page instead of
+        counting through skip rows"""
+        statement = (
+            select(User).order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+        )
+        # skip only applies to offset paging; with a cursor it would skip
+        # rows past the cursor a second time
+        if after is None:
+            statement = statement.offset(skip)
+        else:
+            statement = statement.where(tuple_(User.created_at, User.id) < after)
         result = await self.db.scalars(statement)
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(f"UserRepository.get_users took {elapsed_ms:.2f}ms")
-
-        return list(result.all())
+        return result.all()
 
     async def update_user(self, user_id: UUID, values: dict) -> User:
-        start = perf_counter()
-
         statement = (
             update(User).where(User.id == user_id).values(**values).returning(User)
         )
         result = await self.db.execute(statement)
-        await self.db.commit()
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        self.logger.info(f"UserRepository.update_user took {elapsed_ms:.2f}ms")
+        invalidate_user(self.db, user_id)
 
         return result.scalar_one()
@@ -1,15 +1,12 @@
-from time import perf_counter
+from hashlib import sha256
 from uuid import UUID
 
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, func, insert, select, text
 
 from src.core.deps import T_Database
-from src.core.logger import setup_logger
 from src.models.verification_code import VerificationCode, VerificationCodeEnum
 from src.schemas.verification_code_schemas import CreateVerificationCodeSchema
 
-logger = setup_logger(__name__)
-
 
 class VerificationCodeRepository:
     def __init__(self, db: T_Database):
@@ -18,45 +15,36 @@ class VerificationCodeRepository:
     async def create_verification_code(
         self, values: CreateVerificationCodeSchema
     ) -> None:
-        start = perf_counter()
-
-        statement = insert(VerificationCode).values(**values.model_dump())
-        await self.db.execute(statement)
-
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(
-            f"VerificationCodeRepository.create_verification_code took {elapsed_ms:.2f}ms"
+        statement = insert(VerificationCode).values(
+            **values.model_dump(exclude={"token"}),
+            token=sha256(values.token.encode()).digest(),
         )
+        await self.db.execute(statement)
 
     async def get_verification_code_by_token(
         self, token: str
     ) -> VerificationCode | None:
-        start = perf_counter()
-
         statement = select(VerificationCode).where(
-            VerificationCode.token == token,
+            VerificationCode.token == sha256(token.encode()).digest(),
         )
         result = await self.db.execute(statement)
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(
-            f"VerificationCodeRepository.get_verification_code_by_token took {elapsed_ms:.2f}ms"
-        )
-
         return result.scalar_one_or_none()
 
     async def delete_verification_code(
         self, user_id: UUID, identifier: VerificationCodeEnum
     ) -> None:
-        start = perf_counter()
-
         statement = delete(VerificationCode).where(
             VerificationCode.user_id == user_id,
             VerificationCode.identifier == identifier,
         )
         await self.db.execute(statement)
 
-        elapsed_ms = (perf_counter() - start) * 1000
-        logger.info(
-            f"VerificationCodeRepository.delete_verification_code took {elapsed_ms:.2f}ms"
+    async def delete_expired_verification_codes(self) -> int:
+        # kept for a day past expiry so stale links still get the "expired" error
+        statement = delete(VerificationCode).where(
+            VerificationCode.expires_at < func.now() - text("interval '1 day'")
         )
+        result = await self.db.execute(statement)
+
+        return result.rowcount
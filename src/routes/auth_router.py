@@ -72,7 +72,7 @@ async def sign_out(session: T_Session, deps: T_AuthDeps):
 
 @router.get("/me", status_code=HTTPStatus.OK, response_model=UserWithInformationSchema)
 async def get_current_user(user: T_CurrentUser, deps: T_AuthDeps):
-    return await deps.service.get_me(user_id=user.id)
+    return await deps.service.get_me(user=user)
 
 
 @router.post("/resend-verification", status_code=HTTPStatus.OK)
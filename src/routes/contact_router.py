@@ -5,7 +5,11 @@ from uuid import UUID
 from fastapi import APIRouter, Path, Query
 
 from src.core.dependencies.contact_dependencies import T_ContactDeps
-from src.schemas.contact_schemas import ContactSchema, CreateContactSchema
+from src.schemas.contact_schemas import (
+    ContactPageSchema,
+    ContactSchema,
+    CreateContactSchema,
+)
 
 router = APIRouter(tags=["contact"], prefix="/contacts")
 
@@ -22,8 +26,14 @@ async def get_contact(
     return await deps.service.get_contact_by_id(contact_id=id)
 
 
-@router.get("", status_code=HTTPStatus.OK, response_model=list[ContactSchema])
+@router.get("", status_code=HTTPStatus.OK, response_model=ContactPageSchema)
 async def get_contacts(
-    deps: T_ContactDeps, skip: int = Query(0, ge=0), limit: int = Query(100, le=100)
+    deps: T_ContactDeps,
+    skip: Annotated[int, Query(ge=0, description="Ignored when after is given")] = 0,
+    limit: Annotated[int, Query(le=100)] = 100,
+    after: Annotated[
+        UUID | None,
+        Query(description="The nextAfter of the previous page"),
+    ] = None,
 ):
-    return await deps.service.get_contacts(skip=skip, limit=limit)
+    return await deps.service.get_contacts(skip=skip, limit=limit, after=after)
@@ -10,6 +10,7 @@ from src.schemas.user_schemas import (
     OnboardUserSchema,
     UpdateUserSchema,
     UserInformation,
+    UserPageSchema,
     UserSchema,
 )
 
@@ -24,13 +25,17 @@ async def delete_user(
     return await deps.service.delete_user(id=user_id)
 
 
-@router.get("", status_code=HTTPStatus.OK, response_model=list[UserSchema])
+@router.get("", status_code=HTTPStatus.OK, response_model=UserPageSchema)
 async def get_users(
     deps: T_UserDeps,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, le=100),
+    skip: Annotated[int, Query(ge=0, description="Ignored when after is given")] = 0,
+    limit: Annotated[int, Query(le=100)] = 100,
+    after: Annotated[
+        UUID | None,
+        Query(description="The nextAfter of the previous page"),
+    ] = None,
 ):
-    return await deps.service.get_users(skip, limit)
+    return await deps.service.get_users(skip, limit, after)
 
 
 @router.patch("/{user_id}")
@@ -70,4 +75,4 @@ async def onboard_user(user: T_CurrentUser, deps: T_UserDeps, body: OnboardUserS
 
 # @router.delete("/temp/{file_id}")
 # async def delete_file(file_id: str, deps: T_UserDeps):
-#     deps.storage_client.delete_file(file_id)
+#     await deps.storage_client.delete_file(file_id)
@@ -1,10 +1,26 @@
 import enum
 from datetime import datetime
 from typing import Literal
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
-from src.core.constants import PASSWORD_REGEX
+from src.core.constants import (
+    PASSWORD_MAX_LENGTH,
+    PASSWORD_MIN_LENGTH,
+    PASSWORD_SPECIAL_REGEX,
+    PASSWORD_UPPERCASE_REGEX,
+)
+
+
+def _is_valid_password(value: str) -> bool:
+    # Length is checked first so oversized input is rejected without a scan
+    return (
+        PASSWORD_MIN_LENGTH <= len(value) <= PASSWORD_MAX_LENGTH
+        and "\n" not in value
+        and PASSWORD_UPPERCASE_REGEX.search(value) is not None
+        and PASSWORD_SPECIAL_REGEX.search(value) is not None
+    )
 
 
 class RoleEnum(str, enum.Enum):
@@ -14,8 +30,9 @@ class RoleEnum(str, enum.Enum):
 
 
 class TokenBase(BaseModel):
-    sub: str
-    sessionId: str
+    # parsed once when the token is decoded, so callers get UUIDs directly
+    sub: UUID
+    sessionId: UUID
     exp: datetime
     iat: datetime
 
@@ -39,7 +56,7 @@ class SignUpSchema(BaseModel):
     @field_validator("password", mode="after")
     @classmethod
     def validate_password(cls, value: str) -> str:
-        if not PASSWORD_REGEX.match(value):
+        if not _is_valid_password(value):
             raise ValueError(
                 "Password must be 8-64 characters long, contain at least one uppercase letter and one special character (!@#$%^&*)."
             )
@@ -69,7 +86,7 @@ class ResetPasswordSchema(BaseModel):
     @field_validator("password", mode="after")
     @classmethod
     def validate_password(cls, value: str) -> str:
-        if not PASSWORD_REGEX.match(value):
+        if not _is_valid_password(value):
             raise ValueError(
                 "Password must be 8-64 characters long, contain at least one uppercase letter and one special character (!@#$%^&*)."
             )
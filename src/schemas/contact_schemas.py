@@ -25,3 +25,11 @@ class ContactSchema(CreateContactSchema):
     submitted_at: datetime = Field(alias="submittedAt")
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime | None = Field(alias="updatedAt", default=None)
+
+
+class ContactPageSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: list[ContactSchema]
+    # Pass as after to fetch the next page; None once the last page is reached
+    next_after: UUID | None = Field(alias="nextAfter", default=None)
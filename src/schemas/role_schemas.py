@@ -0,0 +1,10 @@
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RoleSchema(BaseModel):
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    id: UUID
+    name: str
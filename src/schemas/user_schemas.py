@@ -24,6 +24,14 @@ class UserSchema(CreateUserSchema):
     updated_at: datetime | None = Field(alias="updatedAt", default=None)
 
 
+class UserPageSchema(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: list[UserSchema]
+    # Pass as after to fetch the next page; None once the last page is reached
+    next_after: UUID | None = Field(alias="nextAfter", default=None)
+
+
 class AddRoleToUserSchema(BaseModel):
     user_id: UUID
     role: RoleEnum
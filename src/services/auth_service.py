@@ -1,3 +1,5 @@
+import asyncio
+import hmac
 import random
 import secrets
 from datetime import datetime, timedelta, timezone
@@ -6,11 +8,11 @@ from uuid import UUID
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
 
 from src.clients.email import EmailClient
 from src.clients.token import JWTClient
-from src.core.config import base_settings
+from src.core.config import get_base_settings
 from src.core.constants import SESSION_EXPIRE_DAYS, VERIFICATION_CODE_EXPIRE_MINUTES
 from src.core.logger import setup_logger
 from src.models.verification_code import VerificationCodeEnum
@@ -31,6 +33,8 @@ from src.schemas.user_schemas import (
 )
 from src.schemas.verification_code_schemas import CreateVerificationCodeSchema
 
+password_hasher = PasswordHasher()
+
 
 class AuthService:
     def __init__(
@@ -44,6 +48,7 @@ class AuthService:
         verification_code_repository: VerificationCodeRepository,
         email_client: EmailClient,
         jwt_client: JWTClient,
+        background_tasks: BackgroundTasks,
     ):
         self.account_repository = account_repository
         self.user_repository = user_repository
@@ -54,6 +59,7 @@ class AuthService:
         self.verification_code_repository = verification_code_repository
         self.email_client = email_client
         self.jwt_client = jwt_client
+        self.background_tasks = background_tasks
         self.logger = setup_logger(__name__)
 
     async def sign_up(self, body: SignUpSchema) -> UserSchema:
@@ -80,7 +86,7 @@ class AuthService:
             CreateAccountSchema(
                 account_id="email",
                 provider_id="credentials",
-                password=self._hash_password(body.password),
+                password=await self._hash_password(body.password),
                 user_id=user.id,
             )
         )
@@ -88,16 +94,14 @@ class AuthService:
             f"AuthService.sign_up . Created account with 'provider_id' of 'credentials' for user {body.email}"
         )
 
-        for role in body.roles:
-            role = await self.role_repository.get_role_by_name(name=role)
-            if role is not None:
-                await self.user_to_role_repository.create_user_to_role(
-                    user_id=user.id,
-                    role_id=role.id,
-                )
-                self.logger.info(
-                    f"AuthService.sign_up . Created user to role link with role {role.name} for user {body.email}"
-                )
+        roles = await self.role_repository.get_roles_by_names(names=body.roles)
+        await self.user_to_role_repository.create_user_to_roles(
+            user_id=user.id,
+            role_ids=[role.id for role in roles],
+        )
+        self.logger.info(
+            f"AuthService.sign_up . Created user to role links with roles {[role.name for role in roles]} for user {body.email}"
+        )
 
         code = self._generate_verification_code()
         token = self._generate_token()
@@ -111,9 +115,14 @@ class AuthService:
             )
         )
 
-        verification_url = f"{base_settings.base_url}/verify-email?token={token}"
-        self.email_client.send_verification_email(
-            email=user.email, code=code, link=verification_url
+        verification_url = f"{get_base_settings().base_url}/verify-email?token={token}"
+        # sent after the response so the request does not wait on Resend
+        self.background_tasks.add_task(
+            self.email_client.send_in_background,
+            self.email_client.send_verification_email,
+            email=user.email,
+            code=code,
+            link=verification_url,
         )
         self.logger.info(
             f"AuthService.sign_up - Sending verification email to {user.email}"
@@ -122,21 +131,15 @@ class AuthService:
         return UserSchema.model_validate(user)
 
     async def sign_in(self, email: str, password: str) -> TokenResponse:
-        user = await self.user_repository.get_user_by_email(email=email)
-        if user is None:
+        result = await self.user_repository.get_user_for_sign_in(email=email)
+        if result is None:
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Incorrect email or password",
             )
+        user, password_hash, roles = result
 
-        # find the users account with credentials
-        accounts = await self.account_repository.get_accounts_by_user_id(
-            user_id=user.id
-        )
-        account = next(
-            (acc for acc in accounts if acc.provider_id == "credentials"), None
-        )
-        if account is None or account.password is None:
+        if password_hash is None:
             # when this occurs, a user has made an account with a different provider such as google or facebook
             # they must sign in with that provider if they do not have a password setup
             raise HTTPException(
@@ -145,29 +148,23 @@ class AuthService:
             )
 
         try:
-            self._validate_password(account.password, password)
+            await self._validate_password(password_hash, password)
         except VerifyMismatchError:
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Incorrect email or password",
             )
 
-        # get the roles that user has and add all of them to the token
-        roles = await self.role_repository.get_roles_by_user_id(user_id=user.id)
-
         # then, create a session and create tokens
-        session = await self.session_repository.create_session(
+        session_id = await self.session_repository.create_session(
             CreateSessionSchema(
                 expires_at=datetime.now(timezone.utc)
                 + timedelta(days=SESSION_EXPIRE_DAYS),
                 user_id=user.id,
             )
         )
-        access_token = self.jwt_client.create_access_token(
-            user_id=user.id, session_id=session.id, roles=[role.name for role in roles]
-        )
-        refresh_token = self.jwt_client.create_refresh_token(
-            user_id=user.id, session_id=session.id
+        access_token, refresh_token = self.jwt_client.create_token_pair(
+            user_id=user.id, session_id=session_id, roles=roles
         )
 
         self.logger.info(f"AuthService.sign_in - {email} logged in successfully")
@@ -196,7 +193,7 @@ class AuthService:
                 detail="Invalid verification code type",
             )
 
-        if verification_code.value != code:
+        if not hmac.compare_digest(verification_code.value.encode(), code.encode()):
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Verification code is incorrect",
@@ -230,8 +227,8 @@ class AuthService:
     async def refresh_token(self, refresh_token: str) -> TokenResponse:
         # no need to throw since the decoding method throws
         decoded_refresh_token = self.jwt_client.decode_refresh_token(refresh_token)
-        user_id = UUID(decoded_refresh_token.sub)
-        session_id = UUID(decoded_refresh_token.sessionId)
+        user_id = decoded_refresh_token.sub
+        session_id = decoded_refresh_token.sessionId
 
         session = await self.session_repository.get_session_by_id(session_id=session_id)
         if session is None:
@@ -250,12 +247,9 @@ class AuthService:
 
         roles = await self.role_repository.get_roles_by_user_id(user_id=user_id)
 
-        access_token = self.jwt_client.create_access_token(
+        access_token, refresh_token = self.jwt_client.create_token_pair(
             user_id=user_id, session_id=session_id, roles=[role.name for role in roles]
         )
-        refresh_token = self.jwt_client.create_refresh_token(
-            user_id=user_id, session_id=session_id
-        )
 
         self.logger.info(
             f"AuthService.refresh_token - Successfully refresh tokens for {str(user_id)}"
@@ -300,8 +294,13 @@ class AuthService:
             )
         )
 
-        reset_url = f"{base_settings.base_url}/reset-password?token={token}"
-        self.email_client.send_password_reset_email(email=user.email, link=reset_url)
+        reset_url = f"{get_base_settings().base_url}/reset-password?token={token}"
+        self.background_tasks.add_task(
+            self.email_client.send_in_background,
+            self.email_client.send_password_reset_email,
+            email=user.email,
+            link=reset_url,
+        )
 
     async def reset_password(self, body: ResetPasswordSchema) -> None:
         verification_code = await (
@@ -339,12 +338,16 @@ class AuthService:
                 status_code=HTTPStatus.NOT_FOUND, detail="No account found"
             )
 
-        hashed = self._hash_password(body.password)
+        hashed = await self._hash_password(body.password)
         await self.account_repository.update_account(
             user_id=verification_code.user_id,
             provider_id="credentials",
             values={"password": hashed},
         )
+        # sign out everywhere so a stolen session does not outlive the reset
+        await self.session_repository.delete_sessions_by_user_id(
+            user_id=verification_code.user_id
+        )
 
         await self.verification_code_repository.delete_verification_code(
             user_id=verification_code.user_id,
@@ -387,29 +390,38 @@ class AuthService:
             )
         )
 
-        verification_url = f"{base_settings.base_url}/verify-email?token={token}"
-        self.email_client.send_verification_email(
-            email=user.email, code=code, link=verification_url
+        verification_url = f"{get_base_settings().base_url}/verify-email?token={token}"
+        # sent after the response so the request does not wait on Resend
+        self.background_tasks.add_task(
+            self.email_client.send_in_background,
+            self.email_client.send_verification_email,
+            email=user.email,
+            code=code,
+            link=verification_url,
         )
 
         self.logger.info(
             f"AuthService.resend_verification - Resent verification email to {email}"
         )
 
-    async def get_me(self, user_id: UUID) -> UserWithInformationSchema:
-        user = await self.user_repository.get_user_with_information(user_id)
-        return UserWithInformationSchema.model_validate(user)
+    async def get_me(self, user: UserSchema) -> UserWithInformationSchema:
+        # the user row was already resolved for authentication, so only the
+        # profile still needs to be loaded
+        user_info = await self.user_info_repository.get_user_info_by_user_id(user.id)
+        return UserWithInformationSchema.model_validate(
+            {**dict(user), "user_info": user_info}
+        )
 
     def _generate_verification_code(self) -> str:
         return str(random.randint(100000, 999999))
 
-    def _validate_password(self, hash: str, password: str) -> bool:
-        ph = PasswordHasher()
-        return ph.verify(hash, password)
+    # argon2 is deliberately slow and CPU bound, so run it in a worker thread
+    # to keep the event loop free for other requests
+    async def _validate_password(self, hash: str, password: str) -> bool:
+        return await asyncio.to_thread(password_hasher.verify, hash, password)
 
-    def _hash_password(self, password: str) -> str:
-        ph = PasswordHasher()
-        return ph.hash(password)
+    async def _hash_password(self, password: str) -> str:
+        return await asyncio.to_thread(password_hasher.hash, password)
 
     def _generate_token(self) -> str:
         return secrets.token_urlsafe(32)
@@ -5,7 +5,11 @@ from fastapi import HTTPException
 
 from src.repositories.contact_repository import ContactRepository
 from src.repositories.user_repository import UserRepository
-from src.schemas.contact_schemas import ContactSchema, CreateContactSchema
+from src.schemas.contact_schemas import (
+    ContactPageSchema,
+    ContactSchema,
+    CreateContactSchema,
+)
 
 
 class ContactService:
@@ -33,6 +37,23 @@ class ContactService:
             )
         return ContactSchema.model_validate(contact)
 
-    async def get_contacts(self, skip: int, limit: int) -> list[ContactSchema]:
-        contacts = await self.contact_repository.get_contacts(skip=skip, limit=limit)
-        return [ContactSchema.model_validate(contact) for contact in contacts]
+    async def get_contacts(
+        self, skip: int, limit: int, after: UUID | None = None
+    ) -> ContactPageSchema:
+        cursor = None
+        if after is not None:
+            last_contact = await self.contact_repository.get_by_id(after)
+            if last_contact is None:
+                raise HTTPException(
+                    detail="after does not match an existing contact",
+                    status_code=HTTPStatus.BAD_REQUEST,
+                )
+            cursor = (last_contact.created_at, last_contact.id)
+
+        contacts = await self.contact_repository.get_contacts(
+            skip=skip, limit=limit, after=cursor
+        )
+        items = [ContactSchema.model_validate(contact) for contact in contacts]
+        # A short page is the last one, so there is nothing to continue from
+        next_after = items[-1].id if items and len(items) == limit else None
+        return ContactPageSchema(items=items, next_after=next_after)
@@ -9,6 +9,7 @@ from src.schemas.user_schemas import (
     OnboardUserSchema,
     UpdateUserSchema,
     UserInformation,
+    UserPageSchema,
     UserSchema,
 )
 
@@ -23,9 +24,26 @@ class UserService:
     async def delete_user(self, id: UUID) -> None:
         await self.user_repository.delete_user(id)
 
-    async def get_users(self, skip: int, limit: int) -> list[UserSchema]:
-        users = await self.user_repository.get_users(skip=skip, limit=limit)
-        return [UserSchema.model_validate(user) for user in users]
+    async def get_users(
+        self, skip: int, limit: int, after: UUID | None = None
+    ) -> UserPageSchema:
+        cursor = None
+        if after is not None:
+            last_user = await self.user_repository.get_user(after)
+            if last_user is None:
+                raise HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail="after does not match an existing user",
+                )
+            cursor = (last_user.created_at, last_user.id)
+
+        users = await self.user_repository.get_users(
+            skip=skip, limit=limit, after=cursor
+        )
+        items = [UserSchema.model_validate(user) for user in users]
+        # A short page is the last one, so there is nothing to continue from
+        next_after = items[-1].id if items and len(items) == limit else None
+        return UserPageSchema(items=items, next_after=next_after)
 
     async def update_user(self, user_id: UUID, body: UpdateUserSchema):
         # update the user's field as usual
@@ -0,0 +1,59 @@
+import base64
+import hashlib
+import hmac
+from http import HTTPStatus
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from src.clients.token import JWTClient
+from src.core.config import get_jwt_settings
+
+SECRET_KEY = "test-secret-key"
+
+
+def _b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _sign(payload: str) -> str:
+    """Sign a raw JSON payload so claims json.dumps would refuse can be tested"""
+    signing_input = (
+        _b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+        + "."
+        + _b64url_encode(payload.encode())
+    )
+    signature = hmac.new(
+        SECRET_KEY.encode(), signing_input.encode(), hashlib.sha256
+    ).digest()
+    return signing_input + "." + _b64url_encode(signature)
+
+
+@pytest.fixture
+def jwt_client(monkeypatch):
+    monkeypatch.setenv("SECRET_KEY", SECRET_KEY)
+    get_jwt_settings.cache_clear()
+    yield JWTClient()
+    get_jwt_settings.cache_clear()
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+@pytest.mark.parametrize("exp", ["1e400", "-1e400", "Infinity", "NaN"])
+def test_non_finite_exp_is_a_decode_error(jwt_client, exp):
+    token = _sign(f'{{"sub":"user","exp":{exp}}}')
+
+    with pytest.raises(jwt.DecodeError):
+        jwt_client._verify(token)
+
+
+@pytest.mark.unit
+@pytest.mark.auth
+def test_non_finite_exp_is_unauthorized(jwt_client):
+    token = _sign('{"sub":"user","exp":1e400}')
+
+    with pytest.raises(HTTPException) as exc_info:
+        jwt_client.decode_access_token(token)
+
+    assert exc_info.value.status_code == HTTPStatus.UNAUTHORIZED